@@ -4,33 +4,59 @@ new Env("Linux.Do 签到")
 """
 
 import os
+import re
 import random
 import time
 import functools
+import collections
 import sys
 import json
 import hashlib
 from datetime import datetime
 from loguru import logger
 from DrissionPage import ChromiumOptions, Chromium
-from tabulate import tabulate
-
-
-def retry_decorator(retries=3):
+from DrissionPage.errors import (
+    CanNotClickError,
+    ContextLostError,
+    ElementLostError,
+    ElementNotFoundError,
+    JavaScriptError,
+    NoRectError,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def retry_decorator(retries=3, initial_backoff=1.0, backoff=2, max_delay=30, jitter=0.5, exceptions=Exception):
+    """
+    重试装饰器，失败后按指数退避并附加随机抖动再重试
+
+    Args:
+        retries (int): 最大尝试次数
+        initial_backoff (float): 首次重试前的等待时间（秒）
+        backoff (float): 每次重试等待时间的增长倍数
+        max_delay (float): 单次等待时间上限（秒），不含抖动
+        jitter (float): 附加随机抖动的最大值（秒）
+        exceptions: 需要重试的异常类型，其他异常直接抛出
+    """
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             for attempt in range(retries):
                 try:
                     return func(*args, **kwargs)
-                except Exception as e:
+                except exceptions as e:
                     if attempt == retries - 1:  # 最后一次尝试
                         logger.error(f"函数 {func.__name__} 最终执行失败: {str(e)}")
+                        raise
+                    sleep_for = min(max_delay, initial_backoff * (backoff ** attempt)) + random.random() * jitter
                     logger.warning(
-                        f"函数 {func.__name__} 第 {attempt + 1}/{retries} 次尝试失败: {str(e)}"
+                        f"函数 {func.__name__} 第 {attempt + 1}/{retries} 次尝试失败: {str(e)}，{sleep_for:.1f}秒后重试"
                     )
-                    time.sleep(1)
-            return None
+                    time.sleep(sleep_for)
 
         return wrapper
 
@@ -42,88 +68,232 @@ os.environ.pop("DYLD_LIBRARY_PATH", None)
 
 USERNAME = os.getenv("LINUXDO_USERNAME")
 PASSWORD = os.getenv("LINUXDO_PASSWORD")
-BROWSE_ENABLED = os.getenv("BROWSE_ENABLED", "true").strip().lower() not in [
-    "false",
-    "0",
-    "off",
-]
+_BROWSE_FALSY = frozenset({"false", "0", "off"})
+BROWSE_ENABLED = os.getenv("BROWSE_ENABLED", "true").strip().lower() not in _BROWSE_FALSY
 if not USERNAME:
     USERNAME = os.getenv("USERNAME")
 if not PASSWORD:
     PASSWORD = os.getenv("PASSWORD")
+_USERNAME_RE = re.compile(re.escape(USERNAME), re.IGNORECASE) if USERNAME else None
 
 HOME_URL = "https://linux.do/"
 LOGIN_URL = "https://linux.do/login"
 
+# 登录状态检测选择器（头像限定在页头，避免匹配到主题列表中发帖人的头像）
+USER_INDICATOR_SELECTOR = (
+    "css:#current-user, #toggle-current-user, .header-dropdown-toggle.current-user, "
+    ".header-dropdown-toggle img.avatar, .user-menu, [data-user-menu]"
+)
+LOGIN_BUTTON_SELECTOR = (
+    "xpath://*[contains(concat(' ', normalize-space(@class), ' '), ' login-button ')]"
+    " | //button[contains(., '登录') or contains(., 'Log In')]"
+)
+
+# 首页主题链接选择器（#list-area 内 class 包含 title 的元素）
+TOPIC_LINK_SELECTOR = "css:#list-area [class*='title']"
+
+# 缓存文件读写缓冲区大小
+CACHE_IO_BUFFER_SIZE = 64 * 1024
+
+# 各平台对应的 User-Agent 平台标识
+_PLATFORM_UA = {
+    "linux": "X11; Linux x86_64",
+    "linux2": "X11; Linux x86_64",
+    "darwin": "Macintosh; Intel Mac OS X 10_15_7",
+    "win32": "Windows NT 10.0; Win64; x64",
+}
+
+# Chromium 启动参数
+_CHROME_ARGS = (
+    "--no-sandbox",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-features=VizDisplayCompositor",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--lang=zh-CN,zh;q=0.9,en;q=0.8",
+)
+
+# 单次调用完成的分段阅读脚本
+# 参数: 分段数, 阅读时间系数, 每段触发交互的概率；返回内容长度、高度和实际阅读时间
+_JS_BROWSE_POST = """
+    const segments = arguments[0];
+    const readFactor = arguments[1];
+    const interactionRate = arguments[2];
+    // 模拟交互：鼠标移动、点击、滚动、焦点事件
+    const interactions = [
+        () => document.dispatchEvent(new MouseEvent('mousemove', {
+            bubbles: true,
+            clientX: Math.random() * window.innerWidth,
+            clientY: Math.random() * window.innerHeight
+        })),
+        () => document.dispatchEvent(new MouseEvent('click', { bubbles: true })),
+        () => window.dispatchEvent(new Event('scroll')),
+        () => document.dispatchEvent(new Event('focus'))
+    ];
+    return (async () => {
+        const content = document.querySelector('.topic-post .cooked') ||
+                        document.querySelector('.post-content') ||
+                        document.querySelector('.post-body') ||
+                        document.body;
+        const length = content.textContent.length;
+        const height = content.scrollHeight;
+        const readMs = Math.max(30, Math.min(300, length / 40)) * readFactor * 1000;
+        const start = Date.now();
+        
+        for (let i = 1; i <= segments; i++) {
+            // 平滑滚动
+            window.scrollTo({top: height * i / segments, behavior: 'smooth'});
+            
+            // 模拟交互，随机选择1-2个
+            if (Math.random() < interactionRate) {
+                const pool = interactions.slice();
+                const count = 1 + Math.floor(Math.random() * 2);
+                for (let j = 0; j < count && pool.length; j++) {
+                    const interact = pool.splice(Math.floor(Math.random() * pool.length), 1)[0];
+                    interact();
+                    await new Promise(resolve => setTimeout(resolve, 100));
+                }
+            }
+            
+            // 分段停留
+            const segmentWait = readMs / segments * (0.7 + Math.random() * 0.5);
+            await new Promise(resolve => setTimeout(resolve, segmentWait));
+        }
+        
+        // 最终滚动到底部
+        window.scrollTo({top: document.body.scrollHeight, behavior: 'smooth'});
+        return {length: length, height: height, readTime: (Date.now() - start) / 1000};
+    })();
+"""
+
+# 页面滚动脚本，滚动距离通过参数传入
+_JS_SCROLL_BY = "window.scrollBy(0, arguments[0]);"
+
+# 模拟用户交互脚本
+_JS_INTERACTIONS = (
+    # 鼠标移动
+    "document.dispatchEvent(new MouseEvent('mousemove', { bubbles: true, clientX: Math.random() * window.innerWidth, clientY: Math.random() * window.innerHeight }));",
+    # 点击事件
+    "document.dispatchEvent(new MouseEvent('click', { bubbles: true }));",
+    # 滚动事件
+    "window.dispatchEvent(new Event('scroll'));",
+    # 焦点事件
+    "document.dispatchEvent(new Event('focus'));",
+)
+
+
+# ======================== JSON 编解码 ========================
+def _json_dumps(obj, indent=True):
+    """序列化为 UTF-8 字节，优先使用 orjson"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(raw):
+    """从 UTF-8 字节反序列化，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _title_ready(title):
+    """判断页面标题是否已离开Cloudflare验证页"""
+    return "请稍候" not in title and "Checking" not in title
+
 
 # ======================== 缓存管理器 ========================
 class CacheManager:
     """缓存管理类，负责缓存文件的读写和管理"""
     
+    # cookies 缓存的 (文件修改时间, 解析结果)，避免同一次运行中重复解析
+    _cookie_cache = None
+
     @staticmethod
-    def get_file_age_hours(file_path):
-        """获取文件年龄（小时）"""
-        if not os.path.exists(file_path):
-            return None
-        file_mtime = os.path.getmtime(file_path)
-        current_time = time.time()
-        age_hours = (current_time - file_mtime) / 3600
-        return age_hours
+    def get_age_hours(timestamp):
+        """根据文件修改时间或创建时间戳计算年龄（小时）"""
+        return (time.time() - timestamp) / 3600
 
     @staticmethod
     def load_cache(file_name):
         """从文件加载缓存数据"""
-        if os.path.exists(file_name):
-            try:
-                with open(file_name, "r", encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                age_hours = CacheManager.get_file_age_hours(file_name)
-                if age_hours is not None:
-                    age_status = "全新" if age_hours < 0.1 else "较新" if age_hours < 6 else "较旧"
-                    logger.info(f"📦 加载缓存 {file_name} (年龄: {age_hours:.3f}小时, {age_status})")
-                
-                return data.get('data', data)
-            except Exception as e:
-                logger.warning(f"缓存加载失败 {file_name}: {str(e)}")
-        else:
+        try:
+            file_mtime = os.stat(file_name).st_mtime
+        except FileNotFoundError:
             logger.info(f"📭 缓存文件不存在: {file_name}")
+            return None
+
+        try:
+            with open(file_name, "rb", buffering=CACHE_IO_BUFFER_SIZE) as f:
+                data = _json_loads(f.read())
+            
+            age_hours = CacheManager.get_age_hours(file_mtime)
+            age_status = "全新" if age_hours < 0.1 else "较新" if age_hours < 6 else "较旧"
+            logger.info(f"📦 加载缓存 {file_name} (年龄: {age_hours:.3f}小时, {age_status})")
+            
+            return data.get('data', data)
+        except Exception as e:
+            logger.warning(f"缓存加载失败 {file_name}: {str(e)}")
         return None
 
     @staticmethod
-    def save_cache(data, file_name):
-        """保存数据到缓存文件"""
+    def save_cache(data, file_name, indent=True):
+        """
+        保存数据到缓存文件
+
+        Args:
+            data: 需要缓存的数据
+            file_name (str): 缓存文件名
+            indent (bool): 是否格式化输出，仅供程序读取的文件可关闭以减小体积
+        """
         try:
+            created = time.time()
             data_to_save = {
                 'data': data,
                 'cache_timestamp': datetime.now().isoformat(),
                 'cache_version': '1.0',
-                'file_created': time.time(),
+                'file_created': created,
             }
             
-            with open(file_name, "w", encoding='utf-8') as f:
-                json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+            payload = _json_dumps(data_to_save, indent=indent)
+            with open(file_name, "wb", buffering=CACHE_IO_BUFFER_SIZE) as f:
+                f.write(payload)
             
-            current_time = time.time()
-            os.utime(file_name, (current_time, current_time))
-            
-            new_age = CacheManager.get_file_age_hours(file_name)
-            file_size = os.path.getsize(file_name)
-            logger.info(f"💾 缓存已保存到 {file_name} (新年龄: {new_age:.3f}小时, 大小: {file_size} 字节)")
+            new_age = CacheManager.get_age_hours(created)
+            logger.info(f"💾 缓存已保存到 {file_name} (新年龄: {new_age:.3f}小时, 大小: {len(payload)} 字节)")
             return True
         except Exception as e:
             logger.error(f"缓存保存失败 {file_name}: {str(e)}")
             return False
 
-    @staticmethod
-    def load_cookies():
-        """加载cookies缓存"""
-        return CacheManager.load_cache("linuxdo_cookies.json")
+    @classmethod
+    def load_cookies(cls):
+        """加载cookies缓存，文件未变化时直接返回上次解析的结果"""
+        file_name = "linuxdo_cookies.json"
+        try:
+            file_mtime = os.stat(file_name).st_mtime_ns
+        except FileNotFoundError:
+            cls._cookie_cache = None
+            return cls.load_cache(file_name)
+        
+        if cls._cookie_cache is not None and cls._cookie_cache[0] == file_mtime:
+            return cls._cookie_cache[1]
+        
+        cookies = cls.load_cache(file_name)
+        cls._cookie_cache = (file_mtime, cookies) if cookies is not None else None
+        return cookies
 
-    @staticmethod
-    def save_cookies(cookies):
+    @classmethod
+    def save_cookies(cls, cookies):
         """保存cookies到缓存"""
-        return CacheManager.save_cache(cookies, "linuxdo_cookies.json")
+        cls._cookie_cache = None
+        return cls.save_cache(cookies, "linuxdo_cookies.json", indent=False)
 
     @staticmethod
     def load_session():
@@ -144,15 +314,30 @@ class CloudflareHandler:
     def is_cf_cookie_valid(cookies):
         """检查Cloudflare cookie是否有效"""
         try:
-            for cookie in cookies:
-                if cookie.get('name') == 'cf_clearance':
-                    expires = cookie.get('expires', 0)
-                    if expires == -1 or expires > time.time():
-                        return True
-            return False
+            now = time.time()
+            return any(
+                cookie.get('name') == 'cf_clearance'
+                and (cookie.get('expires', 0) == -1 or cookie.get('expires', 0) > now)
+                for cookie in cookies
+            )
         except Exception:
             return False
 
+    @staticmethod
+    def wait_challenge_passed(page, wait_time, poll_interval=0.3):
+        """
+        轮询页面标题，直到验证页消失或超出等待时间
+
+        Returns:
+            bool: 等待时间内验证通过返回True，否则返回False
+        """
+        deadline = time.time() + wait_time
+        while time.time() < deadline:
+            if _title_ready(page.title):
+                return True
+            time.sleep(poll_interval)
+        return False
+
     @staticmethod
     def handle_cloudflare(page, max_attempts=8, timeout=180):
         """
@@ -182,8 +367,7 @@ class CloudflareHandler:
                     page.get(HOME_URL)
                     time.sleep(5)
                     
-                    page_title = page.title
-                    if page_title != "请稍候…" and "Checking" not in page_title:
+                    if _title_ready(page.title):
                         logger.success("✅ 使用缓存成功绕过Cloudflare验证")
                         return True
             except Exception as e:
@@ -193,18 +377,17 @@ class CloudflareHandler:
         logger.info("🔄 开始完整Cloudflare验证流程")
         for attempt in range(max_attempts):
             try:
-                current_url = page.url
-                page_title = page.title
-                
                 # 检查页面是否已经正常加载
-                if page_title != "请稍候…" and "Checking" not in page_title:
+                if _title_ready(page.title):
                     logger.success("✅ 页面已正常加载，Cloudflare验证通过")
                     return True
                 
                 # 等待验证
                 wait_time = random.uniform(8, 15)
-                logger.info(f"⏳ 等待Cloudflare验证完成 ({wait_time:.1f}秒) - 尝试 {attempt + 1}/{max_attempts}")
-                time.sleep(wait_time)
+                logger.info(f"⏳ 等待Cloudflare验证完成 (最长{wait_time:.1f}秒) - 尝试 {attempt + 1}/{max_attempts}")
+                if CloudflareHandler.wait_challenge_passed(page, wait_time):
+                    logger.success(f"✅ Cloudflare验证通过 (耗时 {time.time() - start_time:.1f}秒)")
+                    return True
                 
                 # 检查超时
                 if time.time() - start_time > timeout:
@@ -216,8 +399,7 @@ class CloudflareHandler:
                 time.sleep(10)
         
         # 最终检查
-        page_title = page.title
-        if page_title != "请稍候…" and "Checking" not in page_title:
+        if _title_ready(page.title):
             logger.success("✅ 最终验证: Cloudflare验证通过")
             return True
         else:
@@ -230,43 +412,30 @@ class LinuxDoBrowser:
         EXTENSION_PATH = os.path.abspath(
             os.path.join(os.path.dirname(__file__), "turnstilePatch")
         )
-        from sys import platform
-
-        if platform == "linux" or platform == "linux2":
-            platformIdentifier = "X11; Linux x86_64"
-        elif platform == "darwin":
-            platformIdentifier = "Macintosh; Intel Mac OS X 10_15_7"
-        elif platform == "win32":
-            platformIdentifier = "Windows NT 10.0; Win64; x64"
-
-        co = (
-            ChromiumOptions()
-            .headless(True)
-            .add_extension(EXTENSION_PATH)
-            .incognito(True)
-            .set_argument("--no-sandbox")
-            .set_argument("--disable-blink-features=AutomationControlled")
-            .set_argument("--disable-features=VizDisplayCompositor")
-            .set_argument("--disable-background-timer-throttling")
-            .set_argument("--disable-backgrounding-occluded-windows")
-            .set_argument("--disable-renderer-backgrounding")
-            .set_argument("--lang=zh-CN,zh;q=0.9,en;q=0.8")
-        )
+        ua_platform = _PLATFORM_UA.get(sys.platform, "X11; Linux x86_64")
+
+        co = ChromiumOptions().headless(True).add_extension(EXTENSION_PATH).incognito(True)
+        for arg in _CHROME_ARGS:
+            co.set_argument(arg)
         co.set_user_agent(
-            f"Mozilla/5.0 ({platformIdentifier}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
+            f"Mozilla/5.0 ({ua_platform}) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/130.0.0.0 Safari/537.36"
         )
         self.browser = Chromium(co)
         self.page = self.browser.new_tab()
         
         # 加载会话数据
         self.session_data = CacheManager.load_session()
+        self.session_data['browse_history'] = collections.deque(
+            self.session_data.get('browse_history', []), maxlen=50  # 保留最近50条
+        )
         self.cache_saved = False
+        self.topic_tab = None
         
         # 注入增强的反检测脚本
-        self.inject_enhanced_script()
+        self.inject_enhanced_script(self.page)
 
-    def inject_enhanced_script(self):
-        """注入增强的反检测和统计触发脚本"""
+    def inject_enhanced_script(self, page):
+        """注册增强的反检测和统计拦截脚本，该标签页此后每个文档加载前自动执行"""
         enhanced_script = """
         // 增强的反检测脚本
         Object.defineProperty(navigator, 'webdriver', { get: () => undefined });
@@ -330,40 +499,48 @@ class LinuxDoBrowser:
             return originalXHRSend.apply(this, args);
         };
         
-        // 用户行为事件模拟
-        document.addEventListener('DOMContentLoaded', () => {
-            setTimeout(() => {
-                window.dispatchEvent(new Event('pageview'));
-                if (typeof window.onPageView === 'function') {
-                    window.onPageView();
-                }
-            }, 1000);
-        });
-        
-        // 滚动事件统计
-        let lastScrollTime = 0;
-        window.addEventListener('scroll', () => {
-            const now = Date.now();
-            if (now - lastScrollTime > 500) {
-                lastScrollTime = now;
-                window.dispatchEvent(new CustomEvent('scrollActivity', {
-                    detail: { 
-                        scrollY: window.scrollY,
-                        scrollPercent: (window.scrollY / (document.body.scrollHeight - window.innerHeight)) * 100
-                    }
-                }));
-            }
-        });
-        
         console.log('🔧 增强的JS环境模拟已加载');
         """
         
         try:
-            self.page.run_js(enhanced_script)
+            page.add_init_js(enhanced_script)
             logger.info("✅ 增强的反检测脚本已注入")
         except Exception as e:
             logger.warning(f"注入反检测脚本失败: {str(e)}")
 
+    def inject_activity_script(self, page):
+        """在主题页上注册页面浏览和滚动统计事件"""
+        activity_script = """
+        if (!window.__activityListenerAttached) {
+            window.__activityListenerAttached = true;
+            
+            // 用户行为事件模拟
+            if (typeof window.onPageView === 'function') {
+                window.onPageView();
+            }
+            
+            // 滚动事件统计
+            let lastScrollTime = 0;
+            window.addEventListener('scroll', () => {
+                const now = Date.now();
+                if (now - lastScrollTime > 500) {
+                    lastScrollTime = now;
+                    window.dispatchEvent(new CustomEvent('scrollActivity', {
+                        detail: { 
+                            scrollY: window.scrollY,
+                            scrollPercent: (window.scrollY / (document.body.scrollHeight - window.innerHeight)) * 100
+                        }
+                    }));
+                }
+            });
+        }
+        """
+        
+        try:
+            page.run_js(activity_script)
+        except Exception as e:
+            logger.debug(f"注入统计事件脚本失败: {str(e)}")
+
     def save_all_caches(self):
         """统一保存所有缓存"""
         try:
@@ -378,7 +555,9 @@ class LinuxDoBrowser:
                 'login_status': 'success',
                 'last_updated': datetime.now().isoformat(),
             })
-            CacheManager.save_session(self.session_data)
+            CacheManager.save_session(
+                dict(self.session_data, browse_history=list(self.session_data.get('browse_history', ())))
+            )
             
             logger.info("✅ 所有缓存已保存")
             self.cache_saved = True
@@ -439,40 +618,24 @@ class LinuxDoBrowser:
     def check_login_status(self):
         """检查登录状态"""
         try:
-            # 检查用户相关元素
-            user_indicators = [
-                '#current-user', '#toggle-current-user', '.header-dropdown-toggle.current-user',
-                'img.avatar', '.user-menu', '[data-user-menu]'
-            ]
-            
-            for selector in user_indicators:
-                try:
-                    user_elem = self.page.ele(selector)
-                    if user_elem:
-                        logger.success(f"✅ 检测到用户元素: {selector}")
-                        return self.verify_username()
-                except Exception:
-                    continue
-            
-            # 检查登录按钮
-            login_buttons = [
-                '.login-button', 'button:has-text("登录")', 
-                'button:has-text("Log In")', '.btn.btn-icon-text.login-button'
-            ]
-            
-            for selector in login_buttons:
-                try:
-                    login_btn = self.page.ele(selector)
-                    if login_btn:
-                        logger.warning(f"❌ 检测到登录按钮: {selector}")
-                        return False
-                except Exception:
-                    continue
+            # 检查用户相关元素（合并为一次查询）
+            user_elems = self.page.eles(USER_INDICATOR_SELECTOR)
+            if user_elems:
+                logger.success(f"✅ 检测到用户元素: {len(user_elems)} 个")
+                # 元素出现后再获取页面HTML，确保用户名已渲染
+                return self.verify_username(self.page.html)
+            
+            # 检查登录按钮（按class或按钮文字匹配，合并为一次查询）
+            login_btns = self.page.eles(LOGIN_BUTTON_SELECTOR)
+            if login_btns:
+                logger.warning(f"❌ 检测到登录按钮: {login_btns[0].text.strip()}")
+                return False
             
             # 如果无法确定状态
             page_content = self.page.html
-            if "请稍候" not in self.page.title and "Checking" not in self.page.title:
-                if USERNAME.lower() in page_content.lower():
+            page_title = self.page.title
+            if _title_ready(page_title):
+                if _USERNAME_RE.search(page_content) is not None:
                     logger.success(f"✅ 在页面内容中找到用户名: {USERNAME}")
                     return True
                 
@@ -480,42 +643,55 @@ class LinuxDoBrowser:
                     logger.success("✅ 页面显示正常内容，可能已登录")
                     return True
             
-            logger.warning(f"⚠️ 登录状态不确定，默认认为未登录。页面标题: {self.page.title}")
+            logger.warning(f"⚠️ 登录状态不确定，默认认为未登录。页面标题: {page_title}")
             return False
             
         except Exception as e:
             logger.warning(f"检查登录状态时出错: {str(e)}")
             return False
 
-    def verify_username(self):
-        """验证用户名是否显示在页面上"""
+    def verify_username(self, page_content=None):
+        """
+        验证用户名是否显示在页面上
+
+        Args:
+            page_content (str): 已获取的页面HTML，为空时重新获取
+        """
         # 方法1: 页面内容检查
-        page_content = self.page.html
-        if USERNAME.lower() in page_content.lower():
+        if page_content is None:
+            page_content = self.page.html
+        if _USERNAME_RE.search(page_content) is not None:
             logger.success(f"✅ 在页面内容中找到用户名: {USERNAME}")
             return True
         
         # 方法2: 用户菜单点击
         try:
-            user_click_selectors = ['img.avatar', '.current-user', '[data-user-menu]', '.header-dropdown-toggle']
+            # 只点击页头的用户入口，避免点开主题列表中其他用户的头像卡片
+            user_click_selectors = [
+                'css:#current-user', 'css:.header-dropdown-toggle.current-user',
+                'css:.header-dropdown-toggle img.avatar', 'css:[data-user-menu]'
+            ]
             for selector in user_click_selectors:
-                user_elem = self.page.ele(selector)
-                if user_elem:
-                    user_elem.click()
-                    time.sleep(2)
-                    
-                    user_menu_content = self.page.html
-                    if USERNAME.lower() in user_menu_content.lower():
-                        logger.success(f"✅ 在用户菜单中找到用户名: {USERNAME}")
-                        # 点击其他地方关闭菜单
-                        self.page.ele('body').click()
-                        return True
-                    
-                    self.page.ele('body').click()
-                    time.sleep(1)
-                    break
-        except Exception:
-            pass
+                # 上一步已确认页面加载完成，未命中的选择器无需等待
+                user_elem = self.page.ele(selector, timeout=0)
+                if not user_elem:
+                    continue
+                
+                user_elem.click()
+                time.sleep(2)
+                
+                user_menu_content = self.page.html
+                if _USERNAME_RE.search(user_menu_content) is not None:
+                    logger.success(f"✅ 在用户菜单中找到用户名: {USERNAME}")
+                    # 点击其他地方关闭菜单
+                    self.page.ele('tag:body').click()
+                    return True
+                
+                self.page.ele('tag:body').click()
+                time.sleep(1)
+                break
+        except (ElementNotFoundError, ElementLostError, CanNotClickError, NoRectError) as e:
+            logger.debug(f"用户菜单检查失败: {str(e)}")
         
         logger.warning(f"⚠️ 检测到用户元素但无法验证用户名 {USERNAME}，默认认为未登录")
         return False
@@ -581,109 +757,101 @@ class LinuxDoBrowser:
             return False
 
     def click_topic(self):
-        topic_list = self.page.ele("@id=list-area").eles(".:title")
+        topic_list = self.page.eles(TOPIC_LINK_SELECTOR)
         if not topic_list:
             logger.warning("未找到主题帖，尝试刷新页面")
             self.page.refresh()
             time.sleep(3)
-            topic_list = self.page.ele("@id=list-area").eles(".:title")
+            topic_list = self.page.eles(TOPIC_LINK_SELECTOR)
             
         topic_count = len(topic_list)
         browse_count = min(random.randint(4, 8), topic_count)
         logger.info(f"发现 {topic_count} 个主题帖，随机选择 {browse_count} 个进行深度浏览")
         
-        selected_topics = random.sample(topic_list, browse_count)
-        for i, topic in enumerate(selected_topics):
-            logger.info(f"📖 浏览进度: {i+1}/{browse_count}")
-            self.click_one_topic(topic.attr("href"))
-            
-            # 更新浏览历史
-            browse_history = self.session_data.get('browse_history', [])
-            browse_history.append(topic.attr("href"))
-            self.session_data['browse_history'] = browse_history[-50:]  # 保留最近50条
-            
-            # 主题间随机延迟
-            if i < browse_count - 1:
-                delay = random.uniform(8, 15)
-                logger.info(f"⏳ 主题间延迟 {delay:.1f} 秒")
-                time.sleep(delay)
+        # 每个主题只读取一次链接
+        selected_hrefs = [topic.attr("href") for topic in random.sample(topic_list, browse_count)]
+        
+        # 所有主题复用同一个标签页，保持与站点的连接
+        self.open_topic_tab()
+        try:
+            for i, href in enumerate(selected_hrefs):
+                logger.info(f"📖 浏览进度: {i+1}/{browse_count}")
+                try:
+                    self.click_one_topic(href)
+                except Exception:
+                    logger.warning(f"⚠️ 主题浏览失败，跳过: {href}")
+                
+                # 更新浏览历史
+                self.session_data['browse_history'].append(href)
+                
+                # 主题间随机延迟
+                if i < browse_count - 1:
+                    delay = random.uniform(8, 15)
+                    logger.info(f"⏳ 主题间延迟 {delay:.1f} 秒")
+                    time.sleep(delay)
+        finally:
+            self.close_topic_tab()
+
+    def open_topic_tab(self):
+        """打开用于浏览主题的复用标签页"""
+        self.topic_tab = self.browser.new_tab()
+        self.inject_enhanced_script(self.topic_tab)
+        return self.topic_tab
+
+    def close_topic_tab(self):
+        """关闭主题标签页，标签页已崩溃或断开时忽略错误"""
+        if self.topic_tab is None:
+            return
+        try:
+            self.topic_tab.close()
+        except Exception as e:
+            logger.debug(f"关闭主题标签页失败: {str(e)}")
+        self.topic_tab = None
 
-    @retry_decorator()
+    @retry_decorator(initial_backoff=2)
     def click_one_topic(self, topic_url):
-        new_page = self.browser.new_tab()
+        """在复用的主题标签页中打开并浏览单个主题，失败时重建标签页以便重试"""
+        page = self.topic_tab or self.open_topic_tab()
         try:
             full_url = f"https://linux.do{topic_url}" if topic_url.startswith('/') else topic_url
-            new_page.get(full_url)
+            page.get(full_url)
             
             # 等待页面完全加载
             time.sleep(3)
             
             # 触发统计事件
-            self.trigger_statistical_events(new_page)
+            self.inject_activity_script(page)
+            self.trigger_statistical_events(page)
             
             # 增强的浏览行为
-            self.enhanced_browse_post(new_page)
+            self.enhanced_browse_post(page)
             
             # 随机点赞
             if random.random() < 0.25:
-                self.click_like(new_page)
-                
-        finally:
-            new_page.close()
+                self.click_like(page)
+        except Exception:
+            # 标签页可能已崩溃或断开，丢弃后由下一次尝试重新创建
+            self.close_topic_tab()
+            raise
 
     def enhanced_browse_post(self, page):
         """增强的浏览行为，确保统计被正确计数"""
         try:
-            # 获取页面内容信息
-            content_info = page.run_js("""
-                function getContentInfo() {
-                    const content = document.querySelector('.topic-post .cooked') || 
-                                   document.querySelector('.post-content') ||
-                                   document.querySelector('.post-body') ||
-                                   document.body;
-                    return {
-                        length: content.textContent.length,
-                        height: content.scrollHeight,
-                        wordCount: content.textContent.split(/\\s+/).length,
-                        imageCount: content.querySelectorAll('img').length
-                    };
-                }
-                return getContentInfo();
-            """)
-            
-            # 基于内容计算阅读时间
-            base_time = max(30, min(300, content_info['length'] / 40))
-            read_time = base_time * random.uniform(0.8, 1.3)
-            
-            logger.info(f"📖 预计阅读时间: {read_time:.1f}秒 (长度:{content_info['length']}字符)")
-            
-            # 分段滚动模拟
+            # 分段滚动模拟，整个阅读过程在页面内一次完成
             scroll_segments = random.randint(6, 12)
-            time_per_segment = read_time / scroll_segments
+            read_factor = random.uniform(0.8, 1.3)
+            # 阅读时间上限为 300 秒 × 系数 × 最大分段停留倍数，额外留出余量
+            js_timeout = 300 * read_factor * 1.2 + 30
             
-            for segment in range(scroll_segments):
-                # 计算滚动位置
-                scroll_ratio = (segment + 1) / scroll_segments
-                scroll_pos = content_info['height'] * scroll_ratio
-                
-                # 平滑滚动
-                page.run_js(f"""
-                    window.scrollTo({{
-                        top: {scroll_pos},
-                        behavior: 'smooth'
-                    }});
-                """)
-                
-                # 模拟交互
-                if random.random() < 0.4:
-                    self.simulate_user_interaction(page)
-                
-                # 分段停留
-                segment_wait = time_per_segment * random.uniform(0.7, 1.2)
-                time.sleep(segment_wait)
+            result = page.run_js(
+                _JS_BROWSE_POST, scroll_segments, read_factor, 0.4, timeout=js_timeout
+            )
+            # 页面存在弹窗等情况时 run_js 不返回结果，此时不再重复浏览
+            if not result:
+                logger.warning("⚠️ 分段阅读脚本未返回结果，跳过本主题的阅读统计")
+                return
+            logger.info(f"📖 阅读时间: {result['readTime']:.1f}秒 (长度:{result['length']}字符)")
             
-            # 最终滚动到底部
-            page.run_js("window.scrollTo({top: document.body.scrollHeight, behavior: 'smooth'})")
             time.sleep(random.uniform(3, 6))
             
             logger.info("✅ 深度浏览完成")
@@ -699,7 +867,7 @@ class LinuxDoBrowser:
         for _ in range(random.randint(8, 15)):
             # 更自然的滚动距离
             scroll_distance = random.randint(300, 800)
-            page.run_js(f"window.scrollBy(0, {scroll_distance})")
+            page.run_js(_JS_SCROLL_BY, scroll_distance)
             
             # 随机交互
             if random.random() < 0.3:
@@ -724,19 +892,8 @@ class LinuxDoBrowser:
     def simulate_user_interaction(self, page):
         """模拟用户交互行为"""
         try:
-            interactions = [
-                # 鼠标移动
-                "document.dispatchEvent(new MouseEvent('mousemove', { bubbles: true, clientX: Math.random() * window.innerWidth, clientY: Math.random() * window.innerHeight }));",
-                # 点击事件
-                "document.dispatchEvent(new MouseEvent('click', { bubbles: true }));",
-                # 滚动事件
-                "window.dispatchEvent(new Event('scroll'));",
-                # 焦点事件
-                "document.dispatchEvent(new Event('focus'));"
-            ]
-            
             # 随机选择1-2个交互
-            selected = random.sample(interactions, random.randint(1, 2))
+            selected = random.sample(_JS_INTERACTIONS, random.randint(1, 2))
             for js in selected:
                 page.run_js(js)
                 time.sleep(0.1)
@@ -761,8 +918,8 @@ class LinuxDoBrowser:
             for js in statistical_scripts:
                 try:
                     page.run_js(js)
-                except:
-                    pass
+                except (JavaScriptError, ContextLostError):
+                    continue
                     
             time.sleep(1)
             logger.debug("📊 统计事件已触发")
@@ -782,7 +939,7 @@ class LinuxDoBrowser:
                         time.sleep(random.uniform(1, 3))
                         logger.info("点赞成功")
                         return True
-                except:
+                except (ElementLostError, CanNotClickError, NoRectError):
                     continue
             logger.info("未找到可点赞的按钮或已点过赞")
         except Exception as e:
@@ -811,8 +968,11 @@ class LinuxDoBrowser:
         self.browser.quit()
 
     def print_connect_info(self):
+        from tabulate import tabulate
+
         logger.info("获取连接信息")
         page = self.browser.new_tab()
+        self.inject_enhanced_script(page)
         page.get("https://connect.linux.do/")
         time.sleep(3)
         